@@ -0,0 +1,294 @@
+"""Rules that strip AI writing tells from text."""
+import re
+
+# Patterns used by humanize_text, compiled once at import time
+_BOLD_STAR = re.compile(r'\*\*([^*]+)\*\*')
+_BOLD_UNDER = re.compile(r'__([^_]+)__')
+_ITALIC_STAR = re.compile(r'(?<![a-zA-Z])\*([^*\n]+)\*(?![a-zA-Z])')
+_ITALIC_UNDER = re.compile(r'(?<![a-zA-Z])_([^_\n]+)_(?![a-zA-Z])')
+_DOUBLE_DASH = re.compile(r'(?<!\-)\-\-(?!\-)')
+_CODE_BLOCK_FENCE = re.compile(r'```[a-z]*\n?')
+_INLINE_CODE = re.compile(r'`([^`]+)`')
+_EXCLAIM = re.compile(r'!{2,}')
+# A colon, then whitespace-only lines up to a list marker. Each line is taken
+# whole, so the match cannot backtrack over every newline it crossed to try
+# each one as the last; with a plain \s* that was quadratic in a long run of
+# blank lines that leads to no marker.
+_COLON_LIST = re.compile(r':[^\S\n]*\n(?:[^\S\n]*\n)*([^\S\n]*[-*\d])')
+_MULTI_NL = re.compile(r'\n{3,}')
+_MULTI_SP = re.compile(r' {2,}')
+
+# Line-start markers, stripped by three passes in turn, since each one sees
+# the text the one before left behind: a bullet's leading whitespace can span
+# the blank lines a removed header leaves, and a numbered item can be revealed
+# by the header marker ahead of it. The bullet and numbered patterns take a
+# run of whitespace-only lines that leads up to no marker whole and keep it
+# as it is; otherwise every line start in the run would rescan the rest of
+# it, which is quadratic in its length. A bullet already in the "- text" form
+# it would be rewritten to is left unmatched, so clean lists cost no
+# substitution.
+_HEADER = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_BULLET = re.compile(
+    r'^(?:(?P<bullet>[\s]*[*+]\s+|[\s]+-\s+|-(?! \S)\s+)|(?P<blank>(?:[^\S\n]*\n)+))',
+    re.MULTILINE,
+)
+_BULLET_RULES = (('bullet', '- ', None), ('blank', '', 'blank'))
+_NUMBERED = re.compile(r'^(?:(?P<numbered>\s*\d+\.\s+)|(?P<blank>(?:[^\S\n]*\n)+))', re.MULTILINE)
+_NUMBERED_RULES = (('numbered', '', None), ('blank', '', 'blank'))
+
+# Markdown links [text](url). A [ that opens no link is consumed up to the
+# next ] and kept as it is, since every other [ before that ] fails the same
+# way; if no ) is left for its url, nothing after it can be a link either.
+# Trying each of them in turn would rescan the same text over and over.
+_LINK = re.compile(r'(?P<link>\[(?P<link_text>[^\]]+)\]\([^)]+\))|(?P<bracket>\[[^\]]*(?:\]\([^)]*\Z)?)')
+_LINK_RULES = (('link', '', 'link_text'), ('bracket', '', 'bracket'))
+
+# A blockquote marker, optionally followed by a horizontal rule
+_QUOTE_HR = re.compile(r'^(?=>|[-*_]{3,}\s*$)(?P<quote>>\s*)?(?P<hr>[-*_]{3,}\s*$)?', re.MULTILINE)
+_QUOTE_HR_RULES = (('quote', '', None), ('hr', '', None))
+
+# AI-typical sentence starters, matched in one pass. A line can open with
+# several of them; they are tried in this order, so each optional group sees
+# the line the way it would after every earlier starter had been stripped.
+_AI_STARTER_AHEAD = (
+    r"(?=let me |i'll |here's |here is |certainly|of course|absolutely"
+    r"|great question|that's a great |i'd be happy to |i would be happy to )"
+)
+_AI_STARTERS = re.compile(
+    r"(?im)^" + _AI_STARTER_AHEAD +
+    r"(?P<let_me>Let me )?(?P<ill>I'll )?(?P<heres>Here's )?(?P<here_is>Here is )?"
+    r"(?P<certainly>Certainly[,!]?\s*)?(?P<of_course>Of course[,!]?\s*)?"
+    r"(?P<absolutely>Absolutely[,!]?\s*)?(?P<great_question>Great question[,!]?\s*)?"
+    r"(?:(?P<thats_a_great>That's a great )"
+    r"|(?P<id_be_happy>I'd be happy to )?(?P<i_would_be_happy>I would be happy to )?)"
+)
+_AI_STARTER_RULES = (
+    ('let_me', '', None),
+    ('ill', '', None),
+    ('heres', '', None),
+    ('here_is', '', None),
+    ('certainly', '', None),
+    ('of_course', '', None),
+    ('absolutely', '', None),
+    ('great_question', '', None),
+    ('thats_a_great', 'A ', None),
+    ('id_be_happy', '', None),
+    ('i_would_be_happy', '', None),
+)
+# Whether any line opens with a starter: at the very start, or right after a
+# newline. Led by a literal "\n", the second pattern lets re jump from line
+# to line with a fast search instead of trying the ^ anchor at every offset.
+_AI_STARTER_FIRST_LINE = re.compile(r"(?i)" + _AI_STARTER_AHEAD)
+_AI_STARTER_LATER_LINE = re.compile(r"(?i)\n" + _AI_STARTER_AHEAD)
+# The single pass matches each line as the starters, applied one at a time,
+# would leave it, as long as no starter's trailing whitespace runs past the
+# end of its line. Applied one at a time, a later starter is stripped from
+# the next line first, and the earlier starter's \s* then swallows the
+# whitespace that leaves behind: "Intro\nOf course!\nHere's \nthe list"
+# becomes "Intro\nthe list", where one pass gives "Intro\n\nthe list". Text
+# where a starter's whitespace could reach a newline runs the starters one
+# at a time.
+_AI_STARTER_SPANS_LINE = re.compile(r"(?i)(?:certainly|of course|absolutely|great question)[,!]?[^\S\n]*\n")
+_AI_STARTER_PASSES = tuple((re.compile(pattern, re.MULTILINE), replacement) for pattern, replacement in (
+    (r"(?i)^Let me ", ""),
+    (r"(?i)^I'll ", ""),
+    (r"(?i)^Here's ", ""),
+    (r"(?i)^Here is ", ""),
+    (r"(?i)^Certainly[,!]?\s*", ""),
+    (r"(?i)^Of course[,!]?\s*", ""),
+    (r"(?i)^Absolutely[,!]?\s*", ""),
+    (r"(?i)^Great question[,!]?\s*", ""),
+    (r"(?i)^That's a great ", "A "),
+    (r"(?i)^I'd be happy to ", ""),
+    (r"(?i)^I would be happy to ", ""),
+))
+
+# Change-log messages in the order they are reported. humanize_text keeps one
+# count per message and formats only the non-zero ones once all passes ran.
+_CHANGE_MESSAGES = (
+    "Removed %d bold formatting instances",
+    "Removed %d italic formatting instances",
+    "Replaced %d em dashes/double dashes",
+    "Removed %d markdown headers",
+    "Converted %d bullet points",
+    "Simplified %d numbered items",
+    "Removed %d code block markers",
+    "Removed %d inline code markers",
+    "Removed %d AI-typical sentence starters",
+    "Normalized %d excessive exclamation marks",
+    "Adjusted %d colon-before-list patterns",
+    "Simplified %d markdown links",
+    "Removed %d blockquote markers",
+    "Removed %d horizontal rules",
+)
+(
+    _MSG_BOLD, _MSG_ITALIC, _MSG_DASHES, _MSG_HEADERS, _MSG_BULLETS, _MSG_NUMBERED,
+    _MSG_CODE_BLOCKS, _MSG_INLINE_CODE, _MSG_STARTERS, _MSG_EXCLAIMS, _MSG_COLONS,
+    _MSG_LINKS, _MSG_QUOTES, _MSG_HRS,
+) = range(len(_CHANGE_MESSAGES))
+
+
+def _contains_any(text: str, triggers: tuple[str, ...]) -> bool:
+    """Whether text contains any of the trigger strings.
+
+    A plain loop rather than any() over a generator: when this module runs
+    uncompiled, the generator setup costs more than the substring checks
+    themselves on short inputs.
+    """
+    for trigger in triggers:
+        if trigger in text:
+            return True
+    return False
+
+
+def _subn_if(triggers: tuple[str, ...], pattern: re.Pattern[str], replacement: str, text: str) -> tuple[str, int]:
+    """pattern.subn(), skipped when text contains none of the trigger strings.
+
+    Every match of pattern must contain one of the triggers, so a cheap
+    substring check can rule out the whole regex pass.
+    """
+    if _contains_any(text, triggers):
+        return pattern.subn(replacement, text)
+    return text, 0
+
+
+def _fused_sub(
+    pattern: re.Pattern[str],
+    rules: tuple[tuple[str, str, str | None], ...],
+    text: str,
+    triggers: tuple[str, ...] = (),
+) -> tuple[str, dict[str, int]]:
+    """Apply several rules in a single pass of pattern.
+
+    Each rule is a (group, replacement, kept_group) triple: every group that
+    takes part in a match is replaced by replacement followed by the text of
+    kept_group, if any. As with _subn_if, the pass is skipped when text
+    contains none of the triggers; with no triggers it always runs. Returns
+    the new text and the match count per group.
+    """
+    counts = {name: 0 for name, _, _ in rules}
+    if triggers and not _contains_any(text, triggers):
+        return text, counts
+
+    def dispatch(match: re.Match[str]) -> str:
+        parts: list[str] = []
+        for name, replacement, kept in rules:
+            if match[name] is not None:
+                counts[name] += 1
+                parts.append(replacement)
+                if kept and match[kept]:
+                    parts.append(match[kept])
+        return ''.join(parts)
+
+    return pattern.sub(dispatch, text), counts
+
+
+def humanize_text(text: str) -> dict[str, object]:
+    """Remove AI writing tells from text."""
+    original_length = len(text)
+    change_counts = [0] * len(_CHANGE_MESSAGES)
+
+    # 1. Remove markdown bold (**text** or __text__)
+    text, bold_star_count = _subn_if(('**',), _BOLD_STAR, r'\1', text)
+    text, bold_under_count = _subn_if(('__',), _BOLD_UNDER, r'\1', text)
+    change_counts[_MSG_BOLD] = bold_star_count + bold_under_count
+
+    # 2. Remove markdown italic (*text* or _text_) - careful not to break contractions
+    text, italic_star_count = _subn_if(('*',), _ITALIC_STAR, r'\1', text)
+    text, italic_under_count = _subn_if(('_',), _ITALIC_UNDER, r'\1', text)
+    change_counts[_MSG_ITALIC] = italic_star_count + italic_under_count
+
+    # 3. Replace em dashes with regular dashes or commas. str.count returns at
+    # once when the text has no non-Latin-1 characters, and otherwise searches
+    # the native buffer, so encoding to UTF-8 to count bytes would only add a copy
+    em_count = text.count('—')
+    en_count = text.count('–')
+    # Double dashes are counted as they stand in the input. An en dash next to
+    # a hyphen becomes a new "--", or turns one into "---", so with en dashes
+    # present the count is taken ahead of the rewrites
+    double_dash_count = 0
+    if en_count and '--' in text:
+        double_dash_count = len(_DOUBLE_DASH.findall(text))
+    if em_count:
+        text = text.replace('—', ', ')  # em dash
+    if en_count:
+        text = text.replace('–', '-')   # en dash
+    text, replaced_count = _subn_if(('--',), _DOUBLE_DASH, ', ', text)  # double dash
+    if not en_count:
+        double_dash_count = replaced_count
+    change_counts[_MSG_DASHES] = em_count + en_count + double_dash_count
+
+    # 4. Remove markdown headers (# ## ### etc)
+    text, change_counts[_MSG_HEADERS] = _subn_if(('#',), _HEADER, '', text)
+
+    # 5. Convert markdown bullet points to plain text
+    text, counts = _fused_sub(_BULLET, _BULLET_RULES, text, ('-', '*', '+'))
+    change_counts[_MSG_BULLETS] = counts['bullet']
+
+    # 6. Remove numbered list formatting (1. 2. etc) - make them inline
+    text, counts = _fused_sub(_NUMBERED, _NUMBERED_RULES, text, ('.',))
+    change_counts[_MSG_NUMBERED] = counts['numbered']
+
+    # 7. Remove code blocks (```language ... ```)
+    change_counts[_MSG_CODE_BLOCKS] = text.count('```') // 2  # opening and closing fence
+    if '```' in text:
+        text = _CODE_BLOCK_FENCE.sub('', text)
+        text = text.replace('```', '')
+
+    # 8. Remove inline code (`code`)
+    text, change_counts[_MSG_INLINE_CODE] = _subn_if(('`',), _INLINE_CODE, r'\1', text)
+
+    # 9. Remove AI-typical sentence starters
+    if _AI_STARTER_FIRST_LINE.match(text) or _AI_STARTER_LATER_LINE.search(text):
+        if _AI_STARTER_SPANS_LINE.search(text):
+            for pattern, replacement in _AI_STARTER_PASSES:
+                text, starter_count = pattern.subn(replacement, text)
+                change_counts[_MSG_STARTERS] += starter_count
+        else:
+            text, counts = _fused_sub(_AI_STARTERS, _AI_STARTER_RULES, text)
+            change_counts[_MSG_STARTERS] = sum(counts.values())
+
+    # 10. Remove excessive exclamation marks (more than 1)
+    text, change_counts[_MSG_EXCLAIMS] = _subn_if(('!!',), _EXCLAIM, '!', text)
+
+    # 11. Remove trailing colons before lists (AI pattern)
+    text, change_counts[_MSG_COLONS] = _subn_if((':',), _COLON_LIST, r'.\n\1', text)
+
+    # 12. Clean up multiple newlines. This and the multiple-space cleanup stay
+    # two literal patterns: re finds their fixed prefixes with a fast string
+    # search, which an r'\n{3,}| {2,}' alternation would lose, making the one
+    # fused pass slower than both of these together. Folding the colon rule
+    # in as well is slower still, and changes output: the whitespace it keeps
+    # would no longer be collapsed by these passes.
+    text, _ = _subn_if(('\n\n\n',), _MULTI_NL, '\n\n', text)
+
+    # 13. Clean up multiple spaces
+    text, _ = _subn_if(('  ',), _MULTI_SP, ' ', text)
+
+    # 14. Remove links in markdown format [text](url)
+    text, counts = _fused_sub(_LINK, _LINK_RULES, text, ('](',))
+    change_counts[_MSG_LINKS] = counts['link']
+
+    # 15-16. Remove blockquotes and horizontal rules, in one pass
+    text, counts = _fused_sub(_QUOTE_HR, _QUOTE_HR_RULES, text, ('>', '-', '*', '_'))
+    change_counts[_MSG_QUOTES] = counts['quote']
+    change_counts[_MSG_HRS] = counts['hr']
+
+    # Final trim
+    text = text.strip()
+
+    changes = [message % count for message, count in zip(_CHANGE_MESSAGES, change_counts) if count]
+
+    # The caller already has its input, so it is not echoed back
+    return {
+        "humanized": text,
+        "changes": changes,
+        "original_length": original_length,
+        "humanized_length": len(text),
+        "reduction": original_length - len(text)
+    }
+
+
+def humanize_texts(texts: list[str]) -> list[dict[str, object]]:
+    """Humanize each of texts, returning the results in the same order."""
+    return [humanize_text(text) for text in texts]